@@ -262,27 +262,39 @@ EXPORT(coordinates_momentum_phase,{
     if (dtype == NPY_COMPLEX64) {
       ComplexF* d = (ComplexF*)PyArray_DATA(a);
 
+      // convert i*mom to the target precision once instead of for each site
+      std::vector<ComplexF> _imom(nd);
+      for (long j=0;j<nd;j++)
+	_imom[j] = ComplexF(0.0,1.0) * (ComplexF)mom[j];
+      ComplexF* imom = &_imom[0];
+
       thread_for(i,nc,{
 	  long j;
 	  ComplexF arg = 0.0;
 	  for (j=0;j<nd;j++) {
 	    RealF x = s[i*nd+j];
-	    arg+=x * (ComplexF)mom[j];
+	    arg+=x * imom[j];
 	  }
-	  d[i] = exp( ComplexF(0.0,1.0)*arg );
+	  d[i] = exp( arg );
 	});
 
     } else if (dtype == NPY_COMPLEX128) {
       ComplexD* d = (ComplexD*)PyArray_DATA(a);
 
+      // convert i*mom to the target precision once instead of for each site
+      std::vector<ComplexD> _imom(nd);
+      for (long j=0;j<nd;j++)
+	_imom[j] = ComplexD(0.0,1.0) * mom[j];
+      ComplexD* imom = &_imom[0];
+
       thread_for(i,nc,{
 	  long j;
 	  ComplexD arg = 0.0;
 	  for (j=0;j<nd;j++) {
 	    RealD x = s[i*nd+j];
-	    arg+=x * (ComplexD)mom[j];
+	    arg+=x * imom[j];
 	  }
-	  d[i] = exp( ComplexD(0.0,1.0)*arg );
+	  d[i] = exp( arg );
 	});
     }
 
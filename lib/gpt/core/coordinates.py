@@ -30,12 +30,10 @@ def coordinates(o, order="lexicographic", margin_top=None, margin_bottom=None):
             (o, gpt.none), order=order, margin_top=margin_top, margin_bottom=margin_bottom
         )
     elif isinstance(o, tuple) and isinstance(o[0], gpt.grid) and len(o) == 2:
-        dim = len(o[0].ldimensions)
         cb = o[1].tag
         checker_dim_mask = o[0].cb.cb_mask
-        cbf = [o[0].fdimensions[i] // o[0].gdimensions[i] for i in range(dim)]
-        top = [o[0].processor_coor[i] * o[0].ldimensions[i] * cbf[i] for i in range(dim)]
-        bottom = [top[i] + o[0].ldimensions[i] * cbf[i] for i in range(dim)]
+        top = list(o[0].ltop)
+        bottom = list(o[0].lbottom)
 
         if margin_top is not None:
             top = [t - m for t, m in zip(top, margin_top)]
@@ -148,6 +148,13 @@ class grid:
         ) = cgpt.grid_get_processor(self.obj)
         self.gsites = np.prod(self.gdimensions)
 
+        # bounds of the local part of the full lattice, used by coordinates
+        cbf = [self.fdimensions[i] // self.gdimensions[i] for i in range(self.nd)]
+        self.ltop = tuple(
+            [self.processor_coor[i] * self.ldimensions[i] * cbf[i] for i in range(self.nd)]
+        )
+        self.lbottom = tuple([self.ltop[i] + self.ldimensions[i] * cbf[i] for i in range(self.nd)])
+
     def describe(
         self,
     ):  # creates a string without spaces that can be used to construct it again, this should only describe the grid geometry not the mpi
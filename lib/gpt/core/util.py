@@ -21,9 +21,14 @@ import gpt
 import numpy as np
 import copy
 
+# exact types for which is_num can return without further isinstance checks
+_builtin_num_types = frozenset([int, float, complex])
+
 
 # test if of number type
 def is_num(x):
+    if type(x) in _builtin_num_types:
+        return True
     return isinstance(
         x, (int, float, complex, np.int64, gpt.qfloat, gpt.qcomplex)
     ) and not isinstance(x, bool)
@@ -59,9 +64,12 @@ def value_to_tensor(val, otype):
 
 
 def tensor_to_value(value, dtype=np.complex128):
+    # numpy arrays are passed through unchanged, return early for this common case
+    if type(value) is np.ndarray:
+        return value
     if isinstance(value, gpt.tensor):
         value = value.array
-        if value.dtype != dtype:
+        if value.dtype.type is not dtype:
             value = dtype(value)
     elif is_num(value):
         value = np.array([value], dtype=dtype)
@@ -70,13 +78,13 @@ def tensor_to_value(value, dtype=np.complex128):
 
 # list
 def to_list(*values):
-    if len(values) > 1:
-        return zip(*tuple([to_list(v) for v in values]))
-    elif len(values) == 1:
+    if len(values) == 1:
         value = values[0]
         if isinstance(value, list):
             return value
         return [value]
+    elif len(values) > 1:
+        return zip(*tuple([to_list(v) for v in values]))
 
 
 def from_list(value):
@@ -93,15 +93,14 @@ class wilson_clover(shift_eo, matrix_operator):
             self.clover = g.mspincolor(grid)
             self.clover[:] = 0
             I = g.identity(self.clover)
-            for mu in range(self.nd):
-                for nu in range(mu + 1, self.nd):
-                    if mu == (self.nd - 1) or nu == (self.nd - 1):
-                        cp = self.csw_t
-                    else:
-                        cp = self.csw_r
-                    self.clover += (
-                        -0.5 * cp * g.gamma[mu, nu] * I * g.qcd.gauge.field_strength(U, mu, nu)
-                    )
+            planes = [(mu, nu) for mu in range(self.nd) for nu in range(mu + 1, self.nd)]
+            F = g.qcd.gauge.stencil.field_strength(U, planes)
+            for (mu, nu), Fmunu in zip(planes, F):
+                if mu == (self.nd - 1) or nu == (self.nd - 1):
+                    cp = self.csw_t
+                else:
+                    cp = self.csw_r
+                self.clover += -0.5 * cp * g.gamma[mu, nu] * I * Fmunu
 
             if self.open_bc:
                 # set field strength tensor to unity at the temporal boundaries
@@ -159,9 +159,17 @@ def rectangle(
     return results
 
 
-def differentiable_staple(U, mu, nu):
-    staple_up = g.cshift(U[nu], mu, 1) * g.adj(g.cshift(U[mu], nu, 1)) * g.adj(U[nu])
-    staple_down = g.cshift(g.adj(g.cshift(U[nu], mu, 1)) * g.adj(U[mu]) * U[nu], nu, -1)
+def differentiable_staple(U, mu, nu, shifted_links=None):
+    # shifted_links[(nu, mu)] = U[nu](x + mu) can be shared between calls for the same U
+    if shifted_links is None:
+        shifted_links = {}
+    for link, direction in [(nu, mu), (mu, nu)]:
+        if (link, direction) not in shifted_links:
+            shifted_links[(link, direction)] = g.cshift(U[link], direction, 1)
+    U_nu_x_plus_mu = shifted_links[(nu, mu)]
+    U_mu_x_plus_nu = shifted_links[(mu, nu)]
+    staple_up = U_nu_x_plus_mu * g.adj(U_mu_x_plus_nu) * g.adj(U[nu])
+    staple_down = g.cshift(g.adj(U_nu_x_plus_mu) * g.adj(U[mu]) * U[nu], nu, -1)
     return staple_up, staple_down
 
 
@@ -210,12 +218,13 @@ def differentiable_P_and_R(aU):
     ndim = aU[0].otype.shape[0]
     res_P = None
     res_R = None
+    shifted_links = {}
     for mu in range(Nd):
         for nu in range(Nd):
             if mu == nu:
                 continue
 
-            staple_up, staple_down = differentiable_staple(aU, mu, nu)
+            staple_up, staple_down = differentiable_staple(aU, mu, nu, shifted_links)
 
             P = g.sum(g.trace(aU[mu] * staple_up))
             R = g.sum(g.trace(g.adj(staple_down) * staple_up))
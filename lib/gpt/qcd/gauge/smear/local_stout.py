@@ -199,12 +199,16 @@ class local_stout(local_diffeomorphism):
         if False:
             st = g.qcd.gauge.staple_sum(U, mu=self.params["dimension"], rho=rho)[0]
         else:
-            st = g.lattice(U[0])
-            st[:] = 0
+            # the first staple initializes st, avoids zero-filling it first
+            st = None
             for nu in range(len(U)):
                 if nu == self.params["dimension"]:
                     continue
-                st += self.params["rho"] * g.qcd.gauge.staple(U, self.params["dimension"], nu)
+                st_nu = self.params["rho"] * g.qcd.gauge.staple(U, self.params["dimension"], nu)
+                if st is None:
+                    st = g(st_nu)
+                else:
+                    st += st_nu
             # stref = g.qcd.gauge.staple_sum(U, mu=self.params["dimension"], rho=rho)[0]
             # g.message("TEST", g.norm2(st), g.norm2(st-stref))
             # sys.exit(0)
@@ -213,6 +217,20 @@ class local_stout(local_diffeomorphism):
             st = sf(st)
         return g(st * fm), U, fm
 
+    def identities(self, grid, otype):
+        # read-only constant fields, re-used across calls
+        key = (grid, otype.__name__, "identity")
+        if key not in self.cache:
+            adjoint_otype = g.ot_matrix_su_n_adjoint_algebra(otype.Nc)
+            one = g.complex(grid)
+            one[:] = 1
+            self.cache[key] = (
+                one,
+                g.identity(g.lattice(grid, otype)),
+                g.identity(g.lattice(grid, adjoint_otype)),
+            )
+        return self.cache[key]
+
     def __call__(self, fields):
         C_mu, U, fm = self.get_C(fields)
         mu = self.params["dimension"]
@@ -289,16 +307,11 @@ class local_stout(local_diffeomorphism):
             U_mu_x_plus_nu = g.cshift(U[mu], nu, 1)
             Lambda_mu_x_plus_nu = g.cshift(Lambda_mu, nu, 1)
 
-            dst[nu] -= 1j * rho * U_mu_x_plus_nu * g.adj(U_nu_x_plus_mu) * g.adj(U[mu]) * Lambda_mu
+            # products shared by several of the terms below
+            adj_U_mu_U_nu_x_plus_mu = g(g.adj(U_nu_x_plus_mu) * g.adj(U[mu]))
+            W_nu = g(U_mu_x_plus_nu * adj_U_mu_U_nu_x_plus_mu)
 
-            dst[nu] += (
-                1j
-                * rho
-                * Lambda_mu_x_plus_nu
-                * U_mu_x_plus_nu
-                * g.adj(U_nu_x_plus_mu)
-                * g.adj(U[mu])
-            )
+            dst[nu] += 1j * rho * Lambda_mu_x_plus_nu * W_nu - 1j * rho * W_nu * Lambda_mu
 
             dst[mu] -= (
                 1j
@@ -310,7 +323,7 @@ class local_stout(local_diffeomorphism):
             )
 
             dst[mu] += g.cshift(
-                -1j * rho * g.adj(U_nu_x_plus_mu) * g.adj(U[mu]) * Lambda_mu * U[nu],
+                -1j * rho * adj_U_mu_U_nu_x_plus_mu * Lambda_mu * U[nu],
                 nu,
                 -1,
             )
@@ -354,8 +367,7 @@ class local_stout(local_diffeomorphism):
 
         M = g(U_mu * g.adj(C_mu))
 
-        adj_id = g.identity(g.lattice(grid, adjoint_otype))
-        fund_id = g.identity(g.lattice(grid, otype))
+        _, fund_id, adj_id = self.identities(grid, otype)
 
         compute_adj_ab(fund_id, M, N_cb, generators, cache_ab)
 
@@ -458,14 +470,12 @@ class local_stout_action_log_det_jacobian(differentiable_functional):
 
         rho = self.stout.params["rho"]
 
-        one = g.complex(grid)
-        one[:] = 1
+        one, fund_id, aunit = self.stout.identities(grid, U[0].otype)
 
         t("dJdX")
 
         # dJdX -> stencil version
         dJdX = [g(1j * adjoint_generators[b] * one) for b in range(ng)]
-        aunit = g.identity(J_ac)
 
         X = g.copy(Z_ac)
         t2 = g.copy(X)
@@ -485,7 +495,7 @@ class local_stout_action_log_det_jacobian(differentiable_functional):
         nMpInv = g(NxxAd * inv_M_ab)
         MpInvJx = g((-1.0) * inv_M_ab * J_ac)
 
-        PlaqL = g.identity(U[0])
+        PlaqL = fund_id
         PlaqR = g(M * fm)
         FdetV = g.lattice(grid, adjoint_vector_otype)
 
@@ -548,7 +558,7 @@ class local_stout_action_log_det_jacobian(differentiable_functional):
             MpInvJx_bnu = g.cshift(MpInvJx, nu, -1)
 
             # + nu cw
-            PlaqL = g.identity(U[0])
+            PlaqL = fund_id
             PlaqR = minus_fnu_fmu_bnu_bmu
 
             t("compute_adj_ab")
@@ -148,38 +148,15 @@ class stout(diffeomorphism):
                     Lambda_mu_x_plus_nu = Lambda_shifted[nd * mu + nu]
 
                     tt("expr")
-
-                    dst[mu] -= (
-                        1j
-                        * rho_nu_mu
-                        * U_nu_x_plus_mu
-                        * g.adj(U_mu_x_plus_nu)
-                        * g.adj(U[nu])
-                        * Lambda[nu]
-                    )
-
-                    dst[mu] += (
-                        1j
-                        * rho_nu_mu
-                        * Lambda_nu_x_plus_mu
-                        * U_nu_x_plus_mu
-                        * g.adj(U_mu_x_plus_nu)
-                        * g.adj(U[nu])
-                    )
-
-                    dst[mu] -= (
-                        1j
-                        * rho_mu_nu
-                        * U_nu_x_plus_mu
-                        * g.adj(U_mu_x_plus_nu)
-                        * Lambda_mu_x_plus_nu
-                        * g.adj(U[nu])
-                    )
+                    # link products shared by several terms below
+                    M_up = g(U_nu_x_plus_mu * g.adj(U_mu_x_plus_nu))
+                    M_up_nu = g(M_up * g.adj(U[nu]))
+                    M_down = g(g.adj(U_nu_x_plus_mu) * g.adj(U[mu]))
 
                     tt("cshift")
-                    dst[mu] += g.cshift(
-                        1j * rho_nu_mu * g.adj(U_nu_x_plus_mu) * g.adj(U[mu]) * Lambda[nu] * U[nu]
-                        - 1j * rho_mu_nu * g.adj(U_nu_x_plus_mu) * g.adj(U[mu]) * Lambda[mu] * U[nu]
+                    shifted_terms = g.cshift(
+                        1j * rho_nu_mu * M_down * Lambda[nu] * U[nu]
+                        - 1j * rho_mu_nu * M_down * Lambda[mu] * U[nu]
                         - 1j
                         * rho_nu_mu
                         * g.adj(U_nu_x_plus_mu)
@@ -190,6 +167,15 @@ class stout(diffeomorphism):
                         -1,
                     )
 
+                    # accumulate all contributions of this (mu, nu) in a single evaluation
+                    tt("expr")
+                    dst[mu] += (
+                        1j * rho_nu_mu * Lambda_nu_x_plus_mu * M_up_nu
+                        - 1j * rho_nu_mu * M_up_nu * Lambda[nu]
+                        - 1j * rho_mu_nu * M_up * Lambda_mu_x_plus_nu * g.adj(U[nu])
+                        + shifted_terms
+                    )
+
                     tt()
 
         if self.verbose:
@@ -209,11 +195,12 @@ class differentiable_stout:
     def __call__(self, aU):
         nd = len(aU)
         C = [None] * nd
+        shifted_links = {}
         for mu in range(nd):
             for nu in range(nd):
                 if nu == mu:
                     continue
-                su, sd = g.qcd.gauge.differentiable_staple(aU, mu, nu)
+                su, sd = g.qcd.gauge.differentiable_staple(aU, mu, nu, shifted_links)
                 c = g.adj(su + sd)
                 if C[mu] is None:
                     C[mu] = c
@@ -18,6 +18,7 @@
 #
 import gpt as g
 import numpy as np
+from gpt.qcd.gauge.stencil.field_strength import clover_code
 
 default_energy_density_cache = {}
 
@@ -35,10 +36,7 @@ def energy_density(U, field=False, trace=True, cache=default_energy_density_cach
         _P = (0,) * Nd
         for mu in range(Nd):
             for nu in range(mu):
-                code.append((_temp1, -1, 1.0, g.path().f(mu).f(nu).b(mu).b(nu)))
-                code.append((_temp1, _temp1, -1.0, g.path().f(mu).b(nu).b(mu).f(nu)))
-                code.append((_temp1, _temp1, 1.0, g.path().f(nu).b(mu).b(nu).f(mu)))
-                code.append((_temp1, _temp1, -1.0, g.path().b(nu).b(mu).f(nu).f(mu)))
+                code += clover_code(_temp1, mu, nu)
                 code.append(
                     (
                         _temp1,
@@ -0,0 +1,65 @@
+#
+#    GPT - Grid Python Toolkit
+#    Copyright (C) 2024  Christoph Lehner (christoph.lehner@ur.de, https://github.com/lehner/gpt)
+#
+#    This program is free software; you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation; either version 2 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License along
+#    with this program; if not, write to the Free Software Foundation, Inc.,
+#    51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+import gpt as g
+
+default_field_strength_cache = {}
+
+# (Bx, By, Bz, Ex, Ey, Ez)
+default_field_strength_planes = ((1, 2), (2, 0), (0, 1), (3, 0), (3, 1), (3, 2))
+
+
+def clover_code(target, mu, nu, coeff=1.0):
+    leaves = [
+        (1.0, g.path().f(mu).f(nu).b(mu).b(nu)),
+        (-1.0, g.path().f(mu).b(nu).b(mu).f(nu)),
+        (1.0, g.path().f(nu).b(mu).b(nu).f(mu)),
+        (-1.0, g.path().b(nu).b(mu).f(nu).f(mu)),
+    ]
+    return [
+        (target, -1 if i == 0 else target, coeff * sign, path)
+        for i, (sign, path) in enumerate(leaves)
+    ]
+
+
+def field_strength(U, planes=default_field_strength_planes, cache=default_field_strength_cache):
+    # all planes are computed in a single stencil application, so that the
+    # shifted links are shared instead of re-created for each mu, nu separately
+    Nd = len(U)
+
+    tag = f"{U[0].otype.__name__}_{U[0].grid}_{Nd}_{str(planes)}"
+
+    if tag not in cache:
+        code = []
+        Ntarget = len(planes)
+        _P = (0,) * Nd
+        for idx, (mu, nu) in enumerate(planes):
+            assert mu != nu
+            _temp1 = Ntarget + idx
+            code += clover_code(_temp1, mu, nu, 0.125)
+            code.append((idx, -1, 1.0, [(_temp1, _P, 0)]))
+            code.append((idx, idx, -1.0, [(_temp1, _P, 1)]))
+
+        cache[tag] = g.parallel_transport_matrix(U, code, Ntarget)
+
+    F = cache[tag](U)
+
+    if len(planes) == 1:
+        F = [F]
+
+    return F
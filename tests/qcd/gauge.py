@@ -136,6 +136,14 @@ for mu in range(4):
             g.message(f"F_{mu}{nu} adjoint test: {eps2}")
             assert eps2 < 1e-25
 
+# Test fused field strength stencil
+planes = [(1, 2), (2, 0), (0, 1), (3, 0), (3, 1), (3, 2)]
+F = g.qcd.gauge.stencil.field_strength(U, planes)
+for (mu, nu), Fmunu in zip(planes, F):
+    eps2 = g.norm2(Fmunu - g.qcd.gauge.field_strength(U, mu, nu))
+    g.message(f"F_{mu}{nu} stencil test: {eps2}")
+    assert eps2 < 1e-25
+
 
 # Test gauge covariance of staple
 rho = np.array([[0.0 if i == j else 0.1 for i in range(4)] for j in range(4)], dtype=np.float64)
@@ -149,6 +157,17 @@ for mu in range(len(C)):
     g.message(f"Staple q[{mu}] before {q} and after {q_transformed} gauge transformation: {eps}")
     assert eps < 1e-14
 
+# Test staple against staple_sum
+for mu in range(len(C)):
+    C_mu = g.lattice(C[mu])
+    C_mu[:] = 0
+    for nu in range(4):
+        if nu != mu:
+            C_mu += float(rho[mu, nu]) * g.qcd.gauge.staple(U, mu, nu)
+    eps2 = g.norm2(C_mu - C[mu]) / g.norm2(C[mu])
+    g.message(f"Staple[{mu}] versus staple_sum: {eps2}")
+    assert eps2 < 1e-25
+
 # Test topology
 Q = g.qcd.gauge.topological_charge(U)
 eps = abs(Q - 0.18736242691275048)